@@ -42,6 +42,7 @@ Protocols:
           annotated: xxx.uem
 """
 
+import os
 from pathlib import Path
 import string
 
@@ -52,24 +53,63 @@ from pyannote.database.protocol.protocol import ProtocolFile
 import yaml
 import warnings
 from numbers import Number
-from typing import Text, Dict, Callable, Any, Union
+from typing import Text, Dict, Optional, Callable, Any, Union, List, Tuple, FrozenSet, Set
 import functools
 
 from .protocol.protocol import Subset, Scope
 from .protocol.segmentation import SegmentationProtocol
 from .protocol.speaker_diarization import SpeakerDiarizationProtocol
 
-import pkg_resources
+from importlib.metadata import entry_points
 
-from .util import get_annotated
+from .util import get_annotated, compile_template
 
 from .loader import load_lst, load_trial
 
-# All "Loader" classes types (eg RTTMLoader, UEMLoader, ...) retrieved from the entry point.
-LOADERS = {
-    ep.name: ep
-    for ep in pkg_resources.iter_entry_points(group="pyannote.database.loader")
-}
+# messages of warnings that have already been emitted by `_warn_once`
+_WARNED: Set[Tuple[Text, type]] = set()
+
+
+def _warn_once(msg: Text, category: type = UserWarning):
+    """Emit warning only the first time `msg` is encountered
+
+    Some warnings are triggered every time a subset is iterated over.
+    Checking this set is much cheaper than going through `warnings.warn`.
+    """
+    if (msg, category) in _WARNED:
+        return
+    # stacklevel=2 points at the caller, as when it used to call warnings.warn.
+    # only mark it as emitted once warnings.warn returns (it raises with "-W error")
+    warnings.warn(msg, category, stacklevel=2)
+    _WARNED.add((msg, category))
+
+
+@functools.cache
+def _loaders() -> Dict:
+    """All "Loader" classes types (eg RTTMLoader, UEMLoader, ...) retrieved from the entry point.
+
+    Entry points are only scanned the first time this function is called so
+    that importing this module remains cheap.
+    """
+    try:
+        eps = entry_points(group="pyannote.database.loader")
+    except TypeError:
+        # Python < 3.10 does not support selecting entry points by group
+        eps = entry_points().get("pyannote.database.loader", [])
+    return {ep.name: ep for ep in eps}
+
+
+# keep `LOADERS` available as a module attribute (lazily computed)
+def __getattr__(name):
+    if name == "LOADERS":
+        return _loaders()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _loader_for(suffix: Text) -> type:
+    """Resolve (and cache) the "Loader" class registered for `suffix`"""
+    return _loaders()[suffix].load()
 
 
 def Template(template: Text, database_yml: Path) -> Callable[[ProtocolFile], Any]:
@@ -96,19 +136,53 @@ def Template(template: Text, database_yml: Path) -> Callable[[ProtocolFile], Any
     """
 
     path = Path(template)
-    if path.suffix not in LOADERS:
+    if path.suffix not in _loaders():
         msg = f"No loader for files with '{path.suffix}' suffix"
         raise ValueError(msg)
 
-    Loader = LOADERS[path.suffix].load()
+    Loader = _loader_for(path.suffix)
+
+    # parse template once and for all
+    format_template = compile_template(template)
+    _, placeholders, _, _ = zip(*string.Formatter().parse(template))
+    placeholders = set(placeholders) - set([None])
+
+    # when only the file name contains placeholders (e.g. "/path/to/{uri}.csv"),
+    # candidate directories are listed once instead of checking files one by one.
+    directory, name_template = os.path.split(template)
+    if not _has_placeholders(directory):
+        format_name = compile_template(name_template)
+        listings = _list_template_directories(directory.format(), database_yml)
+    else:
+        listings = None
 
     def load(current_file: ProtocolFile):
-        path = resolve_path(Path(template.format(**abs(current_file))), database_yml)
+        # only gather keys needed by the template instead of copying the whole file
+        sub_file = {key: current_file[key] for key in placeholders}
+
+        path = None
+        if listings is not None:
+            name = format_name(sub_file)
+            if "/" not in name and os.sep not in name:
+                for directory, files in listings:
+                    # listings are made once: make sure file was not removed since
+                    if name in files and os.path.isfile(os.path.join(directory, name)):
+                        path = Path(directory) / name
+                        break
+
+        # not found in listings (e.g. file created after directories were listed):
+        # ask the file system directly
+        if path is None:
+            path = Path(format_template(sub_file))
+            try:
+                path = resolve_path(path, database_yml)
+            except FileNotFoundError:
+                pass
 
-        # check if file exists
-        if not path.is_file():
-            msg = f"No such file or directory: '{path}' (via '{template}' template)."
-            raise FileNotFoundError(msg)
+            # check if file exists
+            if not path.is_file():
+                msg = f"No such file or directory: '{path}' (via '{template}' template)."
+                raise FileNotFoundError(msg)
 
         loader = Loader(path)
         return loader(current_file)
@@ -116,6 +190,68 @@ def Template(template: Text, database_yml: Path) -> Callable[[ProtocolFile], Any
     return load
 
 
+def _list_template_directories(
+    directory: Text, database_yml: Optional[Path]
+) -> List[Tuple[Text, FrozenSet[Text]]]:
+    """List files of the directories where templated files may be found
+
+    Candidate directories are looked up in the same order as `resolve_path`:
+    relative to current working directory first, then relative to
+    `database_yml` parent directory.
+
+    Returns
+    -------
+    listings : list of (directory, file names) tuples
+    """
+
+    directory = os.path.expanduser(directory) or "."
+    candidates = [directory]
+    if database_yml is not None:
+        candidates.append(os.path.join(os.fspath(database_yml.parent), directory))
+
+    listings = []
+    for candidate in dict.fromkeys(candidates):
+        try:
+            mtime_ns = os.stat(candidate).st_mtime_ns
+        except OSError:
+            continue
+        listings.append((candidate, _list_files(candidate, mtime_ns)))
+    return listings
+
+
+@functools.lru_cache(maxsize=128)
+def _list_files(directory: Text, mtime_ns: int) -> FrozenSet[Text]:
+    """List (and cache) names of files in `directory`
+
+    `mtime_ns` is the directory modification time, which changes whenever
+    a file is added to or removed from `directory`.
+    """
+    with os.scandir(directory) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_file())
+
+
+@functools.lru_cache(maxsize=128)
+def _load_annotation(suffix: Text, path_str: Text, mtime_ns: int) -> Any:
+    """Instantiate (and cache) the loader for a non-templated file
+
+    Parameters
+    ----------
+    suffix : str
+        File suffix (e.g. ".rttm") used to select the loader.
+    path_str : str
+        Path to the file.
+    mtime_ns : int
+        File modification time. Editing the file gives a new loader instance.
+
+    Returns
+    -------
+    loader : Callable[[ProtocolFile], Any]
+        Loader instance (e.g. RTTMLoader(path)).
+    """
+    Loader = _loader_for(suffix)
+    return Loader(Path(path_str))
+
+
 def NumericValue(value):
     def load(current_file: ProtocolFile):
         return value
@@ -139,20 +275,49 @@ def resolve_path(path: Path, database_yml: Path) -> Path:
         Resolved path.
     """
 
-    path = path.expanduser()
+    parent = None if database_yml is None else os.path.dirname(os.fspath(database_yml))
+    return Path(_resolve_path(os.fspath(path), parent, os.getcwd()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_path(path: Text, parent: Optional[Text], cwd: Text) -> Text:
+    """Cached filesystem probing behind `resolve_path`
+
+    `cwd` is the current working directory. It is only used as part of the cache
+    key because relative paths are first looked up from there.
+
+    Only successful resolutions are cached (FileNotFoundError is not), and
+    cached entries are never invalidated for the lifetime of the process.
+    Works on plain strings (os.path) as Path objects are much more costly.
+    """
+
+    path = os.path.expanduser(path)
 
-    if path.is_file():
+    if os.path.isfile(path):
         return path
 
-    else:
-        relative_path = database_yml.parent / path
-        if relative_path.is_file():
+    elif parent is not None:
+        relative_path = os.path.join(parent, path)
+        if os.path.isfile(relative_path):
             return relative_path
 
     msg = f'Could not find file "{path}".'
     raise FileNotFoundError(msg)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_protocol(name: Text):
+    """Get (and cache) protocol used by meta-protocols
+
+    Cache is cleared by the registry every time a database is loaded.
+    """
+
+    # this is imported here to avoid circular imports
+    from . import registry
+
+    return registry.get_protocol(name)
+
+
 def meta_subset_iter(
     meta_database: Text,
     meta_task: Text,
@@ -180,11 +345,8 @@ def meta_subset_iter(
             REPERE.SpeakerDiarization.Phase2: [train, development]
     """
 
-    # this is imported here to avoid circular imports
-    from . import registry
-
     for protocol, subsets in subset_entries.items():
-        partial_protocol = registry.get_protocol(protocol)
+        partial_protocol = _get_protocol(protocol)
         for subset in subsets:
             method_name = f"{subset}_iter"
             for file in getattr(partial_protocol, method_name)():
@@ -223,10 +385,7 @@ def gather_loaders(
             continue
 
         # check whether value (path) contains placeholders such as {uri} or {subset}
-        _, placeholders, _, _ = zip(*string.Formatter().parse(value))
-        is_template = len(set(placeholders) - set([None])) > 0
-
-        if is_template:
+        if _has_placeholders(value):
 
             # make sure old database.yml specifications still work but warn the user
             # that they can now get rid of this "_" prefix
@@ -236,7 +395,7 @@ def gather_loaders(
                     "when paths defined in 'database.yml' contains placeholders. "
                     "Remove the underscore (_) prefix to get rid of this warning."
                 )
-                warnings.warn(msg)
+                _warn_once(msg)
                 value = value[1:]
 
             lazy_loader[key] = Template(value, database_yml)
@@ -251,22 +410,16 @@ def gather_loaders(
                 raise FileNotFoundError(msg)
 
             # check if loader exists
-            if path.suffix not in LOADERS:
+            if path.suffix not in _loaders():
                 msg = f"No loader for file with '{path.suffix}' suffix"
                 raise TypeError(msg)
 
-            # load custom loader class
-            Loader = LOADERS[path.suffix].load()
-
-            # TODO: As it is right now, every call to "subset_iter" also calls "Loader(path)".
-            # However, calling "Loader(path)" might be time consuming so we should probably cache it:
-            # Current behavior:
-            #   for _ in protocol.train(): pass   # first call is slow (compute Loader(path))
-            #   for _ in protocol.train(): pass   # subsequent calls are equally slow (compute Loader(path))
-            # Proposed behavior:
+            # calling "Loader(path)" might be time consuming so it is cached:
             #   for _ in protocol.train(): pass   # first call is slow (compute and cache Loader(path))
             #   for _ in protocol.train(): pass   # subsequent calls are fast (use cached Loader(path))
-            lazy_loader[key] = Loader(path)
+            lazy_loader[key] = _load_annotation(
+                path.suffix, str(path), path.stat().st_mtime_ns
+            )
     return lazy_loader
 
 
@@ -301,6 +454,74 @@ def subset_iter(
         as "scope" or "classes")
     """
 
+    uris, lazy_loader = _prepare_subset(
+        database=database,
+        task=task,
+        protocol=protocol,
+        subset=subset,
+        entries=entries,
+        database_yml=database_yml,
+    )
+
+    # ProtocolFile copies its 'precomputed' argument, so the same dictionary
+    # can be reused for every file (only "uri" changes from one file to another)
+    precomputed = {"uri": None, "database": database, "subset": subset, **metadata}
+    for uri in uris:
+        precomputed["uri"] = uri
+        yield ProtocolFile(precomputed, lazy=lazy_loader)
+
+
+# subsets prepared by `_prepare_subset`
+# {(database, task, protocol, subset, database_yml, cwd): (entries, files, uris, lazy_loader)}
+# where `files` is the list of (path, mtime_ns) the preparation depends on.
+_PREPARED_SUBSETS: Dict[Tuple, Tuple] = dict()
+
+
+def _prepare_subset(
+    database: Text = None,
+    task: Text = None,
+    protocol: Text = None,
+    subset: Subset = None,
+    entries: Dict = None,
+    database_yml: Path = None,
+) -> Tuple[List[Text], Dict]:
+    """Load list of uris and gather loaders of a subset
+
+    This is where all the (file system) work needed by `subset_iter` happens.
+    It is only done the first time a subset is iterated over, and done again
+    when the LST file (or any other non-templated file) of the subset has been
+    modified since then, or when current working directory has changed.
+
+    Parameters
+    ----------
+    database : str
+        Database name (e.g. MyDatabase)
+    task : str
+        Task name (e.g. SpeakerDiarization, SpeakerVerification)
+    protocol : str
+        Protocol name (e.g. MyProtocol)
+    subset : {"train", "development", "test"}
+        Subset
+    entries : dict
+        Subset entries.
+    database_yml : `Path`
+        Path to the 'database.yml' file
+
+    Returns
+    -------
+    uris : list of str
+        List of uris in the subset.
+    lazy_loader : dict
+        Loaders, as returned by `gather_loaders`.
+    """
+
+    key = (database, task, protocol, subset, str(database_yml), os.getcwd())
+    cached = _PREPARED_SUBSETS.get(key)
+    if cached is not None:
+        cached_entries, files, uris, lazy_loader = cached
+        if cached_entries is entries and _unchanged(files):
+            return uris, lazy_loader
+
     if "uri" in entries:
         uri = entries["uri"]
 
@@ -310,20 +531,42 @@ def subset_iter(
             f"Found deprecated 'uris' entry in {database}.{task}.{protocol}.{subset}. "
             f"Please use 'uri' (singular) instead, in '{database_yml}'."
         )
-        warnings.warn(msg, DeprecationWarning)
+        _warn_once(msg, DeprecationWarning)
 
     else:
         msg = f"Missing mandatory 'uri' entry in {database}.{task}.{protocol}.{subset}"
         raise ValueError(msg)
 
-    uris = load_lst(resolve_path(Path(uri), database_yml))
+    # keep track of files the preparation depends on (before actually loading them)
+    paths = [resolve_path(Path(uri), database_yml)]
+    for name, value in entries.items():
+        if name not in ["uri", "trial"] and isinstance(value, Text):
+            if not _has_placeholders(value):
+                paths.append(resolve_path(Path(value), database_yml))
+    files = [(str(path), path.stat().st_mtime_ns) for path in paths]
+
+    uris = load_lst(paths[0])
 
     lazy_loader = gather_loaders(entries=entries, database_yml=database_yml)
 
-    for uri in uris:
-        yield ProtocolFile(
-            {"uri": uri, "database": database, "subset": subset, **metadata}, lazy=lazy_loader
-        )
+    _PREPARED_SUBSETS[key] = (entries, files, uris, lazy_loader)
+
+    return uris, lazy_loader
+
+
+def _unchanged(files: List[Tuple[Text, int]]) -> bool:
+    """Check that none of the (path, mtime_ns) `files` has been modified"""
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in files)
+    except OSError:
+        return False
+
+
+def _has_placeholders(value: Text) -> bool:
+    """Check whether `value` contains placeholders such as {uri} or {subset}"""
+    _, placeholders, _, _ = zip(*string.Formatter().parse(value or "."))
+    return len(set(placeholders) - set([None])) > 0
+
 
 def subset_trial(
     self,
@@ -358,24 +601,19 @@ def subset_trial(
     # meant to store and cache one `ProtocolFile` instance per file
     files: Dict[Text, ProtocolFile] = dict()
 
+    # reused for every file (see subset_iter)
+    precomputed = {"uri": None, "database": database, "subset": subset}
+
     # iterate trials and use preloaded test files
     for trial in load_trial(resolve_path(Path(entries["trial"]), database_yml)):
         # create `ProtocolFile` only the first time this uri is encountered
         uri1, uri2 = trial["uri1"], trial["uri2"]
-        if uri1 not in files:
-            files[uri1] = self.preprocess(
-                ProtocolFile(
-                    {"uri": uri1, "database": database, "subset": subset},
-                    lazy=lazy_loader,
+        for uri in (uri1, uri2):
+            if uri not in files:
+                precomputed["uri"] = uri
+                files[uri] = self.preprocess(
+                    ProtocolFile(precomputed, lazy=lazy_loader)
                 )
-            )
-        if uri2 not in files:
-            files[uri2] = self.preprocess(
-                ProtocolFile(
-                    {"uri": uri2, "database": database, "subset": subset},
-                    lazy=lazy_loader,
-                )
-            )
 
         yield {
             "reference": trial["reference"],
@@ -393,6 +631,51 @@ def get_init(protocols):
     return init
 
 
+# the following get_* functions build the {subset}_iter and {subset}_trial methods
+# of custom protocols as plain closures (cheaper to call than functools.partialmethod)
+
+
+def get_meta_subset_iter(database, task, protocol, subset, entries, database_yml):
+    def method(self):
+        return meta_subset_iter(database, task, protocol, subset, entries, database_yml)
+
+    method.__name__ = f"{subset}_iter"
+    return method
+
+
+def get_subset_iter(database, task, protocol, subset, entries, database_yml, metadata):
+    def method(self):
+        return subset_iter(
+            self,
+            database=database,
+            task=task,
+            protocol=protocol,
+            subset=subset,
+            entries=entries,
+            database_yml=database_yml,
+            **metadata,
+        )
+
+    method.__name__ = f"{subset}_iter"
+    return method
+
+
+def get_subset_trial(database, task, protocol, subset, entries, database_yml):
+    def method(self):
+        return subset_trial(
+            self,
+            database=database,
+            task=task,
+            protocol=protocol,
+            subset=subset,
+            entries=entries,
+            database_yml=database_yml,
+        )
+
+    method.__name__ = f"{subset}_trial"
+    return method
+
+
 def get_custom_protocol_class_name(database: Text, task: Text, protocol: Text):
     return f"{database}__{task}__{protocol}"
 
@@ -482,42 +765,23 @@ def create_protocol(
                 f"Ignoring '{database}.{task}.{protocol}.{subset}' found in {database_yml} "
                 f"because '{subset}' entries are not supported yet."
             )
-            warnings.warn(msg)
+            _warn_once(msg)
             continue
 
         method_name = f"{subset}_iter"
         if database == "X":
-            methods[method_name] = functools.partial(
-                meta_subset_iter,
-                database,
-                task,
-                protocol,
-                subset,
-                subset_entries,
-                database_yml,
+            methods[method_name] = get_meta_subset_iter(
+                database, task, protocol, subset, subset_entries, database_yml
             )
         else:
 
-            methods[method_name] = functools.partialmethod(
-                subset_iter,
-                database=database,
-                task=task,
-                protocol=protocol,
-                subset=subset,
-                entries=subset_entries,
-                database_yml=database_yml,
-                **metadata,
+            methods[method_name] = get_subset_iter(
+                database, task, protocol, subset, subset_entries, database_yml, metadata
             )
 
             if "trial" in subset_entries.keys():
-                methods[f"{subset}_trial"] = functools.partialmethod(
-                    subset_trial,
-                    database=database,
-                    task=task,
-                    protocol=protocol,
-                    subset=subset,
-                    entries=subset_entries,
-                    database_yml=database_yml,
+                methods[f"{subset}_trial"] = get_subset_trial(
+                    database, task, protocol, subset, subset_entries, database_yml
                 )
 
     #  making custom protocol pickable by adding it to pyannote.database.custom module
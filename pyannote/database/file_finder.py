@@ -33,6 +33,7 @@ from typing import Text
 from pyannote.database.protocol.protocol import ProtocolFile
 from .registry import registry as global_registry
 from .registry import Registry
+from .util import compile_template
 
 
 class FileFinder:
@@ -46,11 +47,12 @@ class FileFinder:
         Database registry. Defaults to `pyannote.database.registry`.
     """
 
+    __slots__ = ("registry",)
+
     def __init__(
         self, 
         registry: Registry = None,
         database_yml: Text = None):
-        super().__init__()
         if registry is None:
             if database_yml is None:
                 registry = global_registry
@@ -82,15 +84,17 @@ class FileFinder:
         uri = current_file["uri"]
         database = current_file["database"]
 
+        # Registry.sources values are always lists of path templates
+        # (single templates are wrapped into a list when database.yml is loaded)
         path_templates = self.registry.sources[database]
-        if isinstance(path_templates, Text):
-            path_templates = [path_templates]
 
         searched = []
         found = []
 
+        keys = {"uri": uri, "database": database}
+
         for path_template in path_templates:
-            path = Path(path_template.format(uri=uri, database=database))
+            path = Path(compile_template(path_template)(keys))
             searched.append(path)
 
             # paths with "*" or "**" patterns are split into two parts,
@@ -109,8 +113,7 @@ class FileFinder:
 
                 root = path.parents[len(parts) - p]
                 pattern = str(path.relative_to(root))
-                found_ = root.glob(pattern)
-                found.extend(found_)
+                found.extend(root.glob(pattern))
 
             # a path without "*" patterns is supposed to be an actual file
             elif path.is_file():
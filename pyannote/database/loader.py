@@ -29,7 +29,9 @@
 
 """Data loaders"""
 
-from typing import Text
+import functools
+import os
+from typing import Text, Tuple
 from pathlib import Path
 import string
 from pyannote.database.util import load_rttm, load_uem, load_lab, load_stm
@@ -68,9 +70,21 @@ def load_lst(file_lst):
         List or uris
     """
 
+    file_lst = str(file_lst)
+    return list(_load_lst(file_lst, os.stat(file_lst).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=128)
+def _load_lst(file_lst: Text, mtime_ns: int) -> Tuple[Text, ...]:
+    """Load (and cache) LST file
+
+    Lines are returned as a tuple so that the cached value is never
+    modified in place (`load_lst` returns a fresh list).
+    """
+
     with open(file_lst, mode="r") as fp:
-        lines = fp.readlines()
-    return [line.strip() for line in lines]
+        lines = (line.strip() for line in fp.read().splitlines())
+        return tuple(line for line in lines if line)
 
 
 def load_trial(file_trial):
@@ -236,9 +236,12 @@ class ProtocolFile(collections.abc.MutableMapping):
                     raise ValueError(msg)
                 precomputed[key] = value
 
+        # ProtocolFile copies its 'precomputed' argument, so the same
+        # dictionary can be reused (and updated in place) for every file
         keys = list(precomputed.keys())
+        precomputed_one = dict()
         for values in zip(*precomputed.values()):
-            precomputed_one = dict(zip(keys, values))
+            precomputed_one.update(zip(keys, values))
             yield ProtocolFile(precomputed_one, self.lazy)
 
 
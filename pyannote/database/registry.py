@@ -28,17 +28,25 @@
 # Hervé BREDIN - http://herve.niderb.fr
 # Alexis PLAQUET
 
+import copy
 from enum import Enum
+import functools
 import os
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Text, Tuple, Type, Union
 import warnings
 
 from pyannote.database.protocol.protocol import Preprocessors, Protocol
-from .custom import create_protocol, get_init
+from .custom import create_protocol, get_init, _get_protocol
 from .database import Database
 import yaml
 
+# use libyaml-based loader when available (much faster than pure Python one)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 # controls what to do in case of protocol name conflict
 class LoadingMode(Enum):
@@ -218,9 +226,11 @@ class Registry:
         # mark it as currently being loaded (to avoid future circular requirements)
         loading.add(database_yml)
 
-        # load configuration
-        with open(database_yml, "r") as f:
-            config = yaml.load(f, Loader=yaml.SafeLoader)
+        # load configuration (deep copy is needed as `config` is modified below)
+        stat = database_yml.stat()
+        config = copy.deepcopy(
+            _load_yaml(str(database_yml), stat.st_mtime_ns, stat.st_size)
+        )
 
         # load every requirement
         requirements = config.pop("Requirements", list())
@@ -394,6 +404,9 @@ class Registry:
 
         self.databases.pop("X", None)
 
+        # sub-protocols of meta protocols may have been overridden
+        _get_protocol.cache_clear()
+
         for db_yml, config in self.configs.items():
             databases = config.get("Protocols", dict())
             if "X" in databases:
@@ -402,6 +415,28 @@ class Registry:
                 )
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml(path: Text, mtime_ns: int, size: int) -> Dict:
+    """Load (and cache) YAML configuration file
+
+    Parameters
+    ----------
+    path : str
+        Path to YAML configuration file.
+    mtime_ns, size : int
+        File modification time and size. Size catches edits made within
+        the file system timestamp resolution.
+
+    Returns
+    -------
+    config : dict
+        Parsed configuration. It is shared between calls and must not be
+        modified in place.
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def _env_config_paths() -> List[Path]:
     """Parse PYANNOTE_DATABASE_CONFIG environment variable
 
@@ -27,6 +27,8 @@
 # Hervé BREDIN - http://herve.niderb.fr
 
 import yaml
+import functools
+import string
 from pathlib import Path
 import warnings
 import pandas as pd
@@ -37,11 +39,55 @@ from typing import Text
 from typing import Union
 from typing import Dict
 from typing import List
+from typing import Callable
+from typing import Mapping
 
 DatabaseName = Text
 PathTemplate = Text
 
 
+@functools.lru_cache(maxsize=None)
+def compile_template(template: PathTemplate) -> Callable[[Mapping], Text]:
+    """Compile path template into a formatting function
+
+    Templates with a single plain {uri} placeholder (e.g. "/path/to/{uri}.wav")
+    are turned into a simple string concatenation so that they do not need to
+    be parsed again and again. Other templates fall back to `str.format_map`.
+    Compiled templates are cached.
+
+    Parameters
+    ----------
+    template : str
+        Path template (e.g. "/path/to/{uri}.wav")
+
+    Returns
+    -------
+    format : Callable[[Mapping], str]
+        Function that takes a mapping (e.g. a ProtocolFile) and returns the
+        formatted template.
+    """
+
+    parsed = list(string.Formatter().parse(template))
+    fields = [
+        (f, field, spec, conversion)
+        for f, (_, field, spec, conversion) in enumerate(parsed)
+        if field is not None
+    ]
+
+    if len(fields) == 1 and fields[0][1:] == ("uri", "", None):
+        # escaped braces ("{{" or "}}") may split literal text into several parts
+        f = fields[0][0]
+        prefix = "".join(literal for literal, _, _, _ in parsed[: f + 1])
+        suffix = "".join(literal for literal, _, _, _ in parsed[f + 1 :])
+
+        def format_uri(mapping: Mapping) -> Text:
+            return prefix + str(mapping["uri"]) + suffix
+
+        return format_uri
+
+    return template.format_map
+
+
 def get_unique_identifier(item):
     """Return unique item identifier
 
@@ -60,18 +106,17 @@ def get_unique_identifier(item):
         Unique item identifier
     """
 
-    IDENTIFIER = ""
-
-    # {database}/{uri}_{channel}
+    # this is called for every single file (e.g. in Protocol.files) so each
+    # combination is handled by one f-string rather than by concatenation
+    uri = item["uri"]
     database = item.get("database", None)
-    if database is not None:
-        IDENTIFIER += f"{database}/"
-    IDENTIFIER += item["uri"]
     channel = item.get("channel", None)
-    if channel is not None:
-        IDENTIFIER += f"_{channel:d}"
 
-    return IDENTIFIER
+    if database is None:
+        return uri if channel is None else f"{uri}_{channel:d}"
+
+    # {database}/{uri}_{channel}
+    return f"{database}/{uri}" if channel is None else f"{database}/{uri}_{channel:d}"
 
 
 # This function is used in custom.py
@@ -333,8 +378,8 @@ def load_lst(file_lst):
     """
 
     with open(file_lst, mode="r") as fp:
-        lines = fp.readlines()
-    return [line.strip() for line in lines]
+        lines = (line.strip() for line in fp.read().splitlines())
+        return [line for line in lines if line]
 
 
 def load_mapping(mapping_txt):
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2023- CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+
+import os
+import warnings
+from pathlib import Path
+
+import pytest
+
+from pyannote.database import custom
+from pyannote.database import ProtocolFile
+from pyannote.database.custom import Template, resolve_path
+from pyannote.database.registry import Registry
+
+
+def test_resolve_path_after_chdir(tmp_path, monkeypatch):
+    (tmp_path / "a" / "lists").mkdir(parents=True)
+    (tmp_path / "a" / "lists" / "l.lst").write_text("uri\n")
+    (tmp_path / "b").mkdir()
+    database_yml = tmp_path / "a" / "database.yml"
+
+    # found relative to current working directory...
+    monkeypatch.chdir(tmp_path / "a")
+    assert resolve_path(Path("lists/l.lst"), database_yml).is_file()
+
+    # ... then relative to database.yml once working directory has changed
+    monkeypatch.chdir(tmp_path / "b")
+    path = resolve_path(Path("lists/l.lst"), database_yml)
+    assert path.is_file()
+    assert path == tmp_path / "a" / "lists" / "l.lst"
+
+
+def test_resolve_path_relative_to_database_yml(tmp_path, monkeypatch):
+    (tmp_path / "lists").mkdir()
+    (tmp_path / "lists" / "l.lst").write_text("uri\n")
+    (tmp_path / "elsewhere").mkdir()
+
+    monkeypatch.chdir(tmp_path / "elsewhere")
+    path = resolve_path(Path("lists/l.lst"), tmp_path / "database.yml")
+    assert path == tmp_path / "lists" / "l.lst"
+
+
+def test_resolve_path_without_database_yml(tmp_path, monkeypatch):
+    (tmp_path / "lists").mkdir()
+    (tmp_path / "lists" / "l.lst").write_text("uri\n")
+
+    monkeypatch.chdir(tmp_path)
+    assert resolve_path(Path("lists/l.lst"), None) == Path("lists/l.lst")
+
+    with pytest.raises(FileNotFoundError):
+        resolve_path(Path("lists/missing.lst"), None)
+
+
+def test_subset_is_prepared_once(tmp_path, monkeypatch):
+    (tmp_path / "train.lst").write_text("filename1\nfilename2\n")
+    (tmp_path / "database.yml").write_text(
+        "Protocols:\n"
+        "  MyPreparedDatabase:\n"
+        "    Protocol:\n"
+        "      MyProtocol:\n"
+        "        train:\n"
+        "          uri: train.lst\n"
+    )
+    registry = Registry()
+    registry.load_database(tmp_path / "database.yml")
+    protocol = registry.get_protocol("MyPreparedDatabase.Protocol.MyProtocol")
+    assert [f["uri"] for f in protocol.train()] == ["filename1", "filename2"]
+
+    # second iteration does not prepare the subset again...
+    def gather_loaders(*args, **kwargs):
+        raise AssertionError("subset should not be prepared again")
+
+    with monkeypatch.context() as m:
+        m.setattr(custom, "gather_loaders", gather_loaders)
+        assert [f["uri"] for f in protocol.train()] == ["filename1", "filename2"]
+
+    # ... unless its LST file has been modified
+    (tmp_path / "train.lst").write_text("filename1\nfilename2\nfilename3\n")
+    stat = os.stat(tmp_path / "train.lst")
+    os.utime(tmp_path / "train.lst", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert len(list(protocol.train())) == 3
+
+
+def write_rttm(path: Path, uri: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"SPEAKER {uri} 1 0.0 1.0 <NA> <NA> spk <NA> <NA>\n")
+
+
+@pytest.fixture
+def rttms(tmp_path, monkeypatch):
+    write_rttm(tmp_path / "rttms" / "filename1.rttm", "filename1")
+    write_rttm(tmp_path / "rttms" / "sub" / "filename2.rttm", "sub/filename2")
+    # make sure files can only be found relative to database.yml
+    (tmp_path / "elsewhere").mkdir()
+    monkeypatch.chdir(tmp_path / "elsewhere")
+    return tmp_path
+
+
+def test_template_relative_to_database_yml(rttms):
+    load = Template("rttms/{uri}.rttm", rttms / "database.yml")
+    annotation = load(ProtocolFile({"uri": "filename1"}))
+    assert annotation.labels() == ["spk"]
+
+
+def test_template_uri_with_separator(rttms):
+    load = Template("rttms/{uri}.rttm", rttms / "database.yml")
+    annotation = load(ProtocolFile({"uri": "sub/filename2"}))
+    assert annotation.labels() == ["spk"]
+
+
+def test_template_missing_file(rttms):
+    load = Template("rttms/{uri}.rttm", rttms / "database.yml")
+    with pytest.raises(FileNotFoundError):
+        load(ProtocolFile({"uri": "missing"}))
+
+
+def test_template_file_created_after_listing(rttms):
+    load = Template("rttms/{uri}.rttm", rttms / "database.yml")
+    load(ProtocolFile({"uri": "filename1"}))
+
+    # simulate coarse mtime granularity: directory mtime does not change
+    stat = os.stat(rttms / "rttms")
+    write_rttm(rttms / "rttms" / "filename3.rttm", "filename3")
+    os.utime(rttms / "rttms", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    annotation = load(ProtocolFile({"uri": "filename3"}))
+    assert annotation.labels() == ["spk"]
+
+
+def test_template_file_removed_after_listing(rttms):
+    load = Template("rttms/{uri}.rttm", rttms / "database.yml")
+    load(ProtocolFile({"uri": "filename1"}))
+
+    (rttms / "rttms" / "filename1.rttm").unlink()
+    with pytest.raises(FileNotFoundError, match="via 'rttms/{uri}.rttm' template"):
+        load(ProtocolFile({"uri": "filename1"}))
+
+
+def test_template_without_database_yml(rttms, monkeypatch):
+    monkeypatch.chdir(rttms)
+    load = Template("rttms/{uri}.rttm", None)
+    annotation = load(ProtocolFile({"uri": "filename1"}))
+    assert annotation.labels() == ["spk"]
+
+
+def test_warn_once():
+    msg = "test_warn_once warning"
+
+    # warnings turned into errors must be raised every time
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for _ in range(2):
+            with pytest.raises(UserWarning):
+                custom._warn_once(msg)
+
+    with pytest.warns(UserWarning) as record:
+        custom._warn_once(msg)
+        custom._warn_once(msg)
+    assert len(record) == 1
+    assert record[0].filename == __file__
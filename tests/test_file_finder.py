@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2023- CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+
+import pytest
+
+from pyannote.database.file_finder import FileFinder
+from pyannote.database.registry import Registry
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for path in [
+        "b/file1.wav",
+        "a/sub/file2.wav",
+        "a/sub/deeper/file3.wav",
+        "a/.hidden/file4.wav",
+        "file5.wav",
+        "a/file1.txt",
+        "real/file6.wav",
+    ]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).touch()
+    # symlinked directory
+    (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+    # directory target
+    (tmp_path / "a" / "file7.zarr").mkdir()
+    return tmp_path
+
+
+def find(tree, template, uri):
+    registry = Registry()
+    registry.sources["X"] = [str(tree / template)]
+    return FileFinder(registry=registry)({"uri": uri, "database": "X"})
+
+
+@pytest.mark.parametrize(
+    "template, uri",
+    [
+        ("**/{uri}.wav", "file2"),
+        ("**/{uri}.wav", "file3"),
+        ("**/{uri}.wav", "file4"),
+        ("**/{uri}.wav", "file5"),
+        ("*/{uri}.wav", "file1"),
+        ("*/sub/**/{uri}.wav", "file3"),
+        ("a/*/{uri}.wav", "file2"),
+        ("**/{uri}.txt", "file1"),
+        ("*/{uri}.zarr", "file7"),
+        ("real/{uri}.wav", "file6"),
+    ],
+)
+def test_file_finder(tree, template, uri):
+    pattern = template.format(uri=uri)
+    expected = list(tree.glob(pattern))
+    assert len(expected) == 1
+    assert find(tree, template, uri) == expected[0]
+
+
+def test_file_finder_symlinked_directory(tree):
+    assert sorted(tree.glob("*/file6.wav")) == [
+        tree / "link" / "file6.wav",
+        tree / "real" / "file6.wav",
+    ]
+    with pytest.raises(FileNotFoundError, match="more than one"):
+        find(tree, "*/{uri}.wav", "file6")
+    assert find(tree, "l*/{uri}.wav", "file6") == tree / "link" / "file6.wav"
+
+
+def test_file_finder_missing(tree):
+    with pytest.raises(FileNotFoundError, match="Could not find"):
+        find(tree, "**/{uri}.wav", "missing")
+
+
+def test_file_finder_new_file(tree):
+    with pytest.raises(FileNotFoundError):
+        find(tree, "**/{uri}.wav", "new")
+
+    # file added in a sub-directory (does not change root mtime)
+    (tree / "a" / "sub" / "new.wav").touch()
+    assert find(tree, "**/{uri}.wav", "new") == tree / "a" / "sub" / "new.wav"
+
+
+def test_file_finder_removed_file(tree):
+    assert find(tree, "**/{uri}.wav", "file2") == tree / "a" / "sub" / "file2.wav"
+
+    (tree / "a" / "sub" / "file2.wav").unlink()
+    with pytest.raises(FileNotFoundError):
+        find(tree, "**/{uri}.wav", "file2")
@@ -29,9 +29,10 @@
 # Hervé BREDIN - http://herve.niderb.fr
 
 import warnings
+from pathlib import Path
 import pytest
 
-from pyannote.database.registry import LoadingMode, _merge_protocols_inplace
+from pyannote.database.registry import LoadingMode, Registry, _merge_protocols_inplace
 
 def test_override_merging_disjoint():
     protocols1 = {
@@ -74,4 +75,19 @@ def test_override_merging_identical():
         assert ("Task1", "Protocol1") in protocols1
         assert protocols1[("Task1", "Protocol1")] == 42
         assert len(protocols1) == 1
-    
\ No newline at end of file
+    
+
+def test_load_same_database_twice():
+    database_yml = Path(__file__).parent / "data" / "database.yml"
+
+    # second registry is loaded from the cached (parsed) configuration
+    # which must not have been modified by the first one
+    registry1 = Registry()
+    registry1.load_database(database_yml)
+    registry2 = Registry()
+    registry2.load_database(database_yml)
+
+    assert registry1.configs == registry2.configs
+    for path, config in registry1.configs.items():
+        assert config is not registry2.configs[path]
+    assert set(registry1) == set(registry2)
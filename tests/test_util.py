@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# The MIT License (MIT)
+
+# Copyright (c) 2023- CNRS
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# AUTHORS
+# Hervé BREDIN - http://herve.niderb.fr
+
+
+import pytest
+
+from pyannote.database.util import compile_template
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "/path/to/{uri}.wav",
+        "{uri}",
+        "{uri}.wav",
+        "/path/to/{uri}",
+        "relative/{uri}/{uri}.wav",
+        "/path/{database}/{uri}.wav",
+        "/{{escaped}}/{uri}.wav",
+        "/a{{b}}c/{uri}.x{{}}",
+        "/path/to/{uri!r}.wav",
+        "/path/to/{uri:>10}.wav",
+        "/path/to/{uri:s}.wav",
+        "/path/without/placeholder.wav",
+    ],
+)
+def test_compile_template(template):
+    mapping = {"uri": "filename1", "database": "MyDatabase"}
+    assert compile_template(template)(mapping) == template.format_map(mapping)